@@ -30,7 +30,7 @@ import base64
 import io
 import time
 from pathlib import Path
-from typing import List, Set
+from typing import Collection, List, Set
 
 import cv2
 import numpy as np
@@ -41,8 +41,8 @@ from PIL import Image, ImageDraw, ImageFont
 from utils.detection import Detection, bgr_to_pil, run_inference
 from utils.model import load_model
 from utils.progress import load_progress, on_quest_completed, save_progress
-from utils.quest import check_detections, generate_quest, get_emoji
-from utils.projects import get_project_suggestions
+from utils.quest import check_detections, generate_quest, get_emoji, get_emoji_by_id
+from utils.projects import Suggestion, get_project_by_title, get_project_suggestions
 from utils.completed import save_completed_project, load_completed_projects, is_project_completed
 
 # ── Page config ───────────────────────────────────────────────────────────────
@@ -915,9 +915,8 @@ st.markdown(
 # ── Session state init ────────────────────────────────────────────────────────
 
 def _init_state() -> None:
-    if "quest_items" not in st.session_state:
-        st.session_state.quest_items        = generate_quest()
-        st.session_state.quest_found        = set()
+    if "quest" not in st.session_state:
+        st.session_state.quest              = generate_quest()
         st.session_state.quest_start_time   = time.time()
         st.session_state.quest_completed    = False
         st.session_state.quest_comp_time    = None
@@ -1008,7 +1007,7 @@ def _inject_sound(sound: str) -> None:
 
 # ── Quest board HTML ──────────────────────────────────────────────────────────
 
-def _quest_board_html(items: List[str], found: Set[str]) -> str:
+def _quest_board_html(items: tuple[str, ...], found: Set[str]) -> str:
     tiles = ""
     for item in items:
         is_found = item in found
@@ -1179,7 +1178,7 @@ def _render_trophy_case(trophies: list[str]) -> None:
 # ── Share card (PIL) ──────────────────────────────────────────────────────────
 
 def _make_share_card(
-    items: List[str],
+    items: tuple[str, ...],
     found: Set[str],
     comp_time: float | None,
     score: int,
@@ -1233,8 +1232,7 @@ def _make_share_card(
 # ── New quest helper ──────────────────────────────────────────────────────────
 
 def _new_quest() -> None:
-    st.session_state.quest_items        = generate_quest()
-    st.session_state.quest_found        = set()
+    st.session_state.quest              = generate_quest()
     st.session_state.quest_start_time   = time.time()
     st.session_state.quest_completed    = False
     st.session_state.quest_comp_time    = None
@@ -1248,6 +1246,14 @@ def _new_quest() -> None:
 
 # ── Quest detection handler ───────────────────────────────────────────────────
 
+def _unique_names(detections: List[Detection]) -> List[str]:
+    """
+    Class names of *detections*, each once, in first-seen (confidence)
+    order; get_project_suggestions() breaks ties in this order.
+    """
+    return list(dict.fromkeys(d.class_name for d in detections))
+
+
 def _handle_detections(
     detections: List[Detection],
     quest_board_slot,
@@ -1255,26 +1261,24 @@ def _handle_detections(
 ) -> None:
     """Update quest state from a list of detections; refresh board + sounds."""
     detected_names = [d.class_name for d in detections]
-    quest_items = st.session_state.quest_items
-    quest_found = st.session_state.quest_found
+    quest = st.session_state.quest
 
-    newly_found = check_detections(detected_names, quest_items, quest_found)
-    bonus_names = [n for n in detected_names if n not in quest_items]
+    newly_found = check_detections(detected_names, quest)
+    bonus_names = [n for n in detected_names if n not in quest.items_set]
 
     for name in newly_found:
-        st.session_state.quest_found.add(name)
+        quest.found.add(name)
         st.session_state.session_score += 50
 
     st.session_state.session_score += len(bonus_names) * 5
 
     with quest_board_slot.container():
         st.markdown(
-            _quest_board_html(quest_items, st.session_state.quest_found),
+            _quest_board_html(quest.items, quest.found),
             unsafe_allow_html=True,
         )
 
-    all_found = set(quest_items) <= st.session_state.quest_found
-    if all_found and not st.session_state.quest_completed:
+    if quest.complete and not st.session_state.quest_completed:
         st.session_state.quest_completed = True
         comp_time = time.time() - st.session_state.quest_start_time
         st.session_state.quest_comp_time = comp_time
@@ -1294,7 +1298,7 @@ def _handle_detections(
 
 # ── Detection result list ─────────────────────────────────────────────────────
 
-def _render_detections(detections: List[Detection], quest_items: List[str]) -> None:
+def _render_detections(detections: List[Detection], quest_items: Collection[str]) -> None:
     if not detections:
         st.info("No objects detected. Try a different angle or image!")
         return
@@ -1305,10 +1309,10 @@ def _render_detections(detections: List[Detection], quest_items: List[str]) -> N
     if quest_hits:
         st.markdown("#### 🎯 Quest Objects Found!")
     for d in quest_hits:
-        already = d.class_name in st.session_state.quest_found
+        already = d.class_name in st.session_state.quest.found
         st.markdown(
             f"""<div class="det-card quest-hit">
-                <span class="det-label">{get_emoji(d.class_name)} {d.class_name}
+                <span class="det-label">{get_emoji_by_id(d.class_id, d.class_name)} {d.class_name}
                 {'✅' if already else '🆕'}</span>
                 <span class="det-conf">{d.confidence:.0%}</span>
             </div>""",
@@ -1320,7 +1324,7 @@ def _render_detections(detections: List[Detection], quest_items: List[str]) -> N
     for d in bonus_finds[:8]:
         st.markdown(
             f"""<div class="det-card">
-                <span class="det-label">{get_emoji(d.class_name)} {d.class_name}</span>
+                <span class="det-label">{get_emoji_by_id(d.class_id, d.class_name)} {d.class_name}</span>
                 <span class="det-bonus">+5 pts</span>
             </div>""",
             unsafe_allow_html=True,
@@ -1331,16 +1335,6 @@ def _render_detections(detections: List[Detection], quest_items: List[str]) -> N
 
 def _render_completed_log() -> None:
     """Render the completed projects expander panel with collapsible rows."""
-    from utils.projects import PROJECT_MAP, COMBO_MAP
-
-    # Build a flat title → project dict lookup for enriching stored records
-    _all_projects: dict[str, dict] = {}
-    for projects in PROJECT_MAP.values():
-        for p in projects:
-            _all_projects.setdefault(p["title"], p)
-    for p in COMBO_MAP.values():
-        _all_projects.setdefault(p["title"], p)
-
     records = load_completed_projects()
 
     _stem_colours = {
@@ -1374,7 +1368,7 @@ def _render_completed_log() -> None:
             meta   = " · ".join(filter(None, [diff, r.get("time_est", ""), dt_str]))
 
             # Enrich from the canonical project definition
-            full      = _all_projects.get(r.get("title", ""), {})
+            full      = get_project_by_title(r.get("title", "")) or {}
             tagline   = r.get("tagline") or full.get("tagline", "")
             learn     = full.get("learn", "")
             steps     = full.get("steps", [])
@@ -1436,7 +1430,7 @@ def _render_completed_log() -> None:
 # ── Project cards renderer ────────────────────────────────────────────────────
 
 def _render_project_cards(
-    suggestions: list[dict],
+    suggestions: list[Suggestion],
     detected_names: list[str] | None = None,
     context: str = "default",
 ) -> None:
@@ -1459,8 +1453,9 @@ def _render_project_cards(
         unsafe_allow_html=True,
     )
 
-    for p in suggestions:
-        is_combo = p.get("_is_combo", False)
+    for s in suggestions:
+        p        = s.project
+        is_combo = s.is_combo
         diff     = p.get("difficulty", "Easy").lower()
 
         if is_combo:
@@ -1532,8 +1527,7 @@ def _render_project_cards(
         if not already_done:
             btn_key = f"complete_{context}_{p['title'].replace(' ', '_')}"
             if st.button("✅ Mark as Complete", key=btn_key, use_container_width=True):
-                p["_objects_detected"] = detected_names or []
-                save_completed_project(p)
+                save_completed_project({**p, "_objects_detected": detected_names or []})
                 st.session_state.completed_project_titles.add(p["title"])
                 st.rerun()
 
@@ -1543,8 +1537,8 @@ def _render_project_cards(
 # ════════════════════════════════════════════════════════════════════════════════
 
 progress    = load_progress()
-quest_items = st.session_state.quest_items
-quest_found = st.session_state.quest_found
+quest_items = st.session_state.quest.items
+quest_found = st.session_state.quest.found
 confidence  = st.session_state.scan_confidence
 model_choice = st.session_state.scan_model
 model      = load_model(model_choice)
@@ -1625,7 +1619,7 @@ with tab_detect:
             st.markdown("---")
             _render_detections(st.session_state.last_detections, [])
 
-            detected_names = [d.class_name for d in st.session_state.last_detections]
+            detected_names = _unique_names(st.session_state.last_detections)
             suggestions    = get_project_suggestions(detected_names, max_results=3)
             _render_project_cards(suggestions, detected_names, context="img")
 
@@ -1703,7 +1697,7 @@ with tab_detect:
 
                     frame_count += 1
                     if frame_count % 60 == 0 and detections:
-                        detected_names = [d.class_name for d in detections]
+                        detected_names = _unique_names(detections)
                         suggestions    = get_project_suggestions(detected_names, max_results=2)
                         with cam_projects_slot.container():
                             _render_project_cards(suggestions, detected_names, context="cam_live")
@@ -1714,7 +1708,7 @@ with tab_detect:
 
         # Show project suggestions from last captured detections
         if not st.session_state.webcam_running and st.session_state.last_detections:
-            detected_names = [d.class_name for d in st.session_state.last_detections]
+            detected_names = _unique_names(st.session_state.last_detections)
             suggestions    = get_project_suggestions(detected_names, max_results=3)
             with cam_projects_slot.container():
                 _render_project_cards(suggestions, detected_names, context="cam_stopped")
@@ -1821,8 +1815,8 @@ with tab_quest:
                         st.image(st.session_state.last_annotated_pil, use_container_width=True)
                         st.markdown('<p class="img-caption">YOLO Detections</p>', unsafe_allow_html=True)
                 st.markdown("---")
-                _render_detections(st.session_state.last_detections, quest_items)
-                detected_names_q = [d.class_name for d in st.session_state.last_detections]
+                _render_detections(st.session_state.last_detections, st.session_state.quest.items_set)
+                detected_names_q = _unique_names(st.session_state.last_detections)
                 suggestions_q = get_project_suggestions(detected_names_q, max_results=3)
                 _render_project_cards(suggestions_q, detected_names_q, context="img_quest")
 
@@ -1875,7 +1869,7 @@ with tab_quest:
                         frame_placeholder_q.image(ann_rgb, channels="RGB", use_container_width=True, caption="Live YOLO Detections")
                         frame_count_q += 1
                         if frame_count_q % 60 == 0 and detections:
-                            dn = [d.class_name for d in detections]
+                            dn = _unique_names(detections)
                             with cam_projects_slot_q.container():
                                 _render_project_cards(get_project_suggestions(dn, max_results=2), dn, context="cam_live")
                         if st.session_state.quest_completed:
@@ -1884,7 +1878,7 @@ with tab_quest:
                 finally:
                     cap.release()
             if not st.session_state.webcam_running and st.session_state.last_detections:
-                dn = [d.class_name for d in st.session_state.last_detections]
+                dn = _unique_names(st.session_state.last_detections)
                 with cam_projects_slot_q.container():
                     _render_project_cards(get_project_suggestions(dn, max_results=3), dn, context="cam_stopped")
 
@@ -1928,7 +1922,7 @@ st.markdown(
 # ── Mobile bottom nav bar (fixed, shown only on screens ≤640px via CSS) ───────
 _streak  = progress.get("streak", 0)
 _score   = st.session_state.session_score
-_n_found = len(st.session_state.quest_found)
+_n_found = len(st.session_state.quest.found)
 
 st.markdown(
     f"""
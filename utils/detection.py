@@ -9,6 +9,7 @@ Computer-vision helpers for:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -116,8 +117,9 @@ def run_inference(
             conf   = float(box.conf.item())
             x1, y1, x2, y2 = (int(v) for v in box.xyxy[0].tolist())
 
-            # Resolve class name from the model's category map.
-            class_name = result.names.get(cls_id, str(cls_id))
+            # Resolve class name from the model's category map. Interned so
+            # the quest and project lookups can match it on identity.
+            class_name = sys.intern(result.names.get(cls_id, str(cls_id)))
 
             detections.append(Detection(
                 class_id=cls_id,
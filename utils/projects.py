@@ -9,34 +9,50 @@ that align with middle-school curriculum standards.
 
 PUBLIC API
 ----------
-  PROJECT_MAP  : dict[str, list[dict]]  — per-class STEM project ideas
-  COMBO_MAP    : dict[frozenset, dict]  — bonus projects for 2+ objects together
-  get_project_suggestions(detected_names, max_results) -> list[dict]
+  PROJECT_MAP  : Mapping[str, tuple[Mapping, ...]] — per-class STEM project ideas
+  COMBO_MAP    : Mapping[frozenset, Mapping]      — bonus projects for 2+ objects together
+  Suggestion   : NamedTuple(score, is_combo, project) — one ranked suggestion
+  get_project_suggestions(detected, max_results) -> list[Suggestion]
+  iter_project_suggestions(detected, max_results) -> Iterator[Suggestion]
+  get_project_by_title(title) -> Mapping | None
+  get_projects(obj_name) -> tuple[Mapping, ...]
+  get_projects_makeable_with(have) -> list[Mapping]
+  find_projects(obj_name, difficulty, max_minutes) -> list[Mapping]
+  find_projects_using(materials) -> list[Mapping]
+  resolve_class(name) -> str | None
+  DIFF_RANK    : Mapping[str, int]                — difficulty label -> sort rank
+  DIFF_LABELS  : tuple[str, ...]                  — difficulty labels, easiest first
 
 Project dict schema
 -------------------
-  title       : str          — short descriptive name
-  emoji       : str          — single representative emoji
-  difficulty  : str          — "Easy" | "Medium" | "Hard"
-  time_est    : str          — e.g. "25 mins"
-  stem_tag    : str          — "Science" | "Engineering" | "Technology" | "Math"
-  tagline     : str          — punchy hook sentence mentioning the STEM concept
-  steps       : List[str]   — 4-5 clear steps a student can follow independently
-  materials   : List[str]   — only common household items + the detected object
-  learn       : str          — "You'll learn about X by doing this."
+  title       : str             — short descriptive name
+  emoji       : str             — single representative emoji
+  difficulty  : str             — "Easy" | "Medium" | "Hard"
+  time_est    : str             — e.g. "25 mins"
+  time_min    : int             — leading minutes parsed from time_est (derived)
+  stem_tag    : str             — "Science" | "Engineering" | "Technology" | "Math"
+  tagline     : str             — punchy hook sentence mentioning the STEM concept
+  steps       : tuple[str, ...] — 4-5 clear steps a student can follow independently
+  materials   : tuple[str, ...] — only common household items + the detected object
+  learn       : str             — "You'll learn about X by doing this."
 """
 
 from __future__ import annotations
 
-from typing import List
+import functools
+import re
+import sys
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, List, Mapping, NamedTuple
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PROJECT_MAP  –  STEM projects for every PREFERRED_CLASS
 # ─────────────────────────────────────────────────────────────────────────────
 
-PROJECT_MAP: dict[str, list[dict]] = {
+PROJECT_MAP: Mapping[str, tuple[Mapping[str, Any], ...]] = {
 
-    "cup": [
+    "cup": (
         {
             "title": "Sound Wave Visualizer",
             "emoji": "🔊",
@@ -88,9 +104,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["cup", "ruler", "pencils", "tape", "coins", "cardboard", "foil"],
             "learn": "You'll learn about levers, counterweights, and how potential energy converts to kinetic energy.",
         },
-    ],
+    ),
 
-    "bottle": [
+    "bottle": (
         {
             "title": "Air Pressure Rocket",
             "emoji": "🚀",
@@ -142,9 +158,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["bottle", "soil", "small rocks", "seedlings", "water", "plastic wrap", "rubber band"],
             "learn": "You'll learn about the water cycle, photosynthesis, and how closed ecosystems sustain themselves.",
         },
-    ],
+    ),
 
-    "book": [
+    "book": (
         {
             "title": "Bridge Load Test",
             "emoji": "🌉",
@@ -196,9 +212,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["book", "eraser", "fabric", "foil", "paper", "stopwatch"],
             "learn": "You'll learn about friction — how surface texture and angle both affect an object's resistance to sliding.",
         },
-    ],
+    ),
 
-    "chair": [
+    "chair": (
         {
             "title": "Pendulum Painting Machine",
             "emoji": "🎨",
@@ -233,9 +249,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["chair", "string", "books", "coins", "rubber band", "bag"],
             "learn": "You'll learn about mechanical advantage — how pulleys multiply force so you lift more with less effort.",
         },
-    ],
+    ),
 
-    "laptop": [
+    "laptop": (
         {
             "title": "Reaction Time Tester",
             "emoji": "⚡",
@@ -287,9 +303,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["laptop", "paper", "pencil", "ruler", "coloured pens"],
             "learn": "You'll learn about data collection, statistical measures, and how to read trends in line graphs.",
         },
-    ],
+    ),
 
-    "cell phone": [
+    "cell phone": (
         {
             "title": "Smartphone Spectrometer",
             "emoji": "🌈",
@@ -341,9 +357,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["cell phone", "paper", "pencil", "ruler"],
             "learn": "You'll learn about the decibel scale — a logarithmic measure of sound intensity.",
         },
-    ],
+    ),
 
-    "keyboard": [
+    "keyboard": (
         {
             "title": "Typing Speed vs. Accuracy Experiment",
             "emoji": "📈",
@@ -378,9 +394,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["keyboard", "9V battery", "LED", "wire", "screwdriver", "paper", "pencil"],
             "learn": "You'll learn about matrix circuits — how keyboards detect keypresses using a grid of rows and columns.",
         },
-    ],
+    ),
 
-    "mouse": [
+    "mouse": (
         {
             "title": "Optical Sensor Dissection",
             "emoji": "🔬",
@@ -415,9 +431,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["mouse", "rubber band", "paper", "fabric", "foil", "cardboard", "ruler"],
             "learn": "You'll learn about friction force and how different surface textures create more or less resistance.",
         },
-    ],
+    ),
 
-    "remote": [
+    "remote": (
         {
             "title": "Infrared Light Detector",
             "emoji": "📡",
@@ -452,9 +468,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["remote", "tv", "ruler", "fabric", "cardboard", "foil", "paper", "pencil"],
             "learn": "You'll learn how IR signals weaken with distance (inverse square law) and how materials absorb radiation.",
         },
-    ],
+    ),
 
-    "clock": [
+    "clock": (
         {
             "title": "Pendulum Clock Builder",
             "emoji": "⏱️",
@@ -506,9 +522,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["clock", "paper plate", "pencil", "marker", "tape"],
             "learn": "You'll learn why time zones were invented and how solar noon differs from clock noon depending on longitude.",
         },
-    ],
+    ),
 
-    "backpack": [
+    "backpack": (
         {
             "title": "Ergonomic Load Experiment",
             "emoji": "⚖️",
@@ -543,9 +559,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["backpack", "zip-lock bag", "water", "thermometer", "newspaper", "fabric", "foil", "cardboard", "clock"],
             "learn": "You'll learn about thermal insulation — how different materials slow the transfer of heat energy.",
         },
-    ],
+    ),
 
-    "teddy bear": [
+    "teddy bear": (
         {
             "title": "Center of Gravity Hunt",
             "emoji": "⚖️",
@@ -580,9 +596,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["teddy bear", "cup", "ruler", "cotton balls", "foam", "paper"],
             "learn": "You'll learn about elasticity and resilience — how materials store and release energy when compressed.",
         },
-    ],
+    ),
 
-    "scissors": [
+    "scissors": (
         {
             "title": "Lever Mechanical Advantage Lab",
             "emoji": "✂️",
@@ -617,9 +633,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["scissors", "paper", "coins", "ruler", "tape"],
             "learn": "You'll learn about structural engineering — why triangles and arches resist collapse better than flat shapes.",
         },
-    ],
+    ),
 
-    "toothbrush": [
+    "toothbrush": (
         {
             "title": "Vibrobot Racer",
             "emoji": "🤖",
@@ -654,9 +670,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["toothbrush", "eggshells", "orange juice", "cola", "milk", "water", "cups", "toothpaste"],
             "learn": "You'll learn about acid erosion — how acidic liquids dissolve calcium carbonate, the same mineral in teeth.",
         },
-    ],
+    ),
 
-    "apple": [
+    "apple": (
         {
             "title": "Oxidation Race",
             "emoji": "🍎",
@@ -691,9 +707,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["apple", "orange", "banana", "carrot", "bowl", "water", "paper", "pencil"],
             "learn": "You'll learn about buoyancy and density — an object floats when its average density is less than the liquid it's in.",
         },
-    ],
+    ),
 
-    "banana": [
+    "banana": (
         {
             "title": "Enzyme Ripeness Experiment",
             "emoji": "🍌",
@@ -728,9 +744,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["banana", "water", "lemon juice", "vinegar", "baking soda", "soap", "milk", "cups"],
             "learn": "You'll learn about pH scale and how plant pigments called anthocyanins change colour in acid vs. base solutions.",
         },
-    ],
+    ),
 
-    "orange": [
+    "orange": (
         {
             "title": "Vitamin C Titration Test",
             "emoji": "🍊",
@@ -765,9 +781,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["orange", "copper coin", "galvanized nail", "wire", "LED", "tape"],
             "learn": "You'll learn about electrochemistry — how two different metals in an acidic solution create an electrical potential.",
         },
-    ],
+    ),
 
-    "couch": [
+    "couch": (
         {
             "title": "Coefficient of Friction Ramp",
             "emoji": "📐",
@@ -802,9 +818,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["couch", "ruler", "books", "bag", "paper", "pencil"],
             "learn": "You'll learn about Hooke's Law — how elastic materials compress proportionally to the load applied.",
         },
-    ],
+    ),
 
-    "potted plant": [
+    "potted plant": (
         {
             "title": "Phototropism Tower Challenge",
             "emoji": "☀️",
@@ -839,9 +855,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["potted plant", "zip-lock bag", "string", "ruler", "paper", "pencil"],
             "learn": "You'll learn about transpiration — the process by which plants release water vapour through tiny pores called stomata.",
         },
-    ],
+    ),
 
-    "bowl": [
+    "bowl": (
         {
             "title": "Standing Wave Patterns",
             "emoji": "🌊",
@@ -876,9 +892,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["bowl", "water", "measuring cup", "rocks", "apple", "soap bar", "key", "paper", "pencil"],
             "learn": "You'll learn about water displacement — how the volume of liquid displaced equals the volume of a submerged object.",
         },
-    ],
+    ),
 
-    "spoon": [
+    "spoon": (
         {
             "title": "Spoon Convex/Concave Mirror Lab",
             "emoji": "🔭",
@@ -913,9 +929,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["spoon", "wool fabric", "water", "ruler"],
             "learn": "You'll learn about electrostatic attraction — how static charge on an insulator attracts nearby polar water molecules.",
         },
-    ],
+    ),
 
-    "fork": [
+    "fork": (
         {
             "title": "Balancing Fork Gravity Trick",
             "emoji": "⚖️",
@@ -950,9 +966,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["fork", "water", "dish soap", "salt", "sugar", "alcohol", "oil", "tissue", "cup"],
             "learn": "You'll learn about surface tension — the cohesive force between water molecules and how surfactants break it.",
         },
-    ],
+    ),
 
-    "vase": [
+    "vase": (
         {
             "title": "Resonant Frequency Finder",
             "emoji": "🎵",
@@ -987,9 +1003,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["vase", "water", "food coloring", "white flowers or celery", "pen", "ruler"],
             "learn": "You'll learn about capillary action — how adhesion and cohesion forces pull water upward through narrow plant vessels.",
         },
-    ],
+    ),
 
-    "bed": [
+    "bed": (
         {
             "title": "Sleep Position Pressure Map",
             "emoji": "🛏️",
@@ -1024,9 +1040,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["bed", "books", "ruler", "scale to weigh books", "paper", "pencil"],
             "learn": "You'll learn about Hooke's Law — that elastic materials compress in direct proportion to the force applied.",
         },
-    ],
+    ),
 
-    "tv": [
+    "tv": (
         {
             "title": "Pixel Colour Mixer",
             "emoji": "🖥️",
@@ -1061,9 +1077,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["tv", "cell phone", "paper", "pencil"],
             "learn": "You'll learn about refresh rate — how often a screen redraws its image per second, and why it matters for motion clarity.",
         },
-    ],
+    ),
 
-    "sink": [
+    "sink": (
         {
             "title": "Water Filter Engineering Challenge",
             "emoji": "💧",
@@ -1098,9 +1114,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["sink", "coin", "water", "dish soap", "straw", "paper", "pencil"],
             "learn": "You'll learn about surface tension and surfactants — how soap molecules disrupt the hydrogen bonds between water molecules.",
         },
-    ],
+    ),
 
-    "refrigerator": [
+    "refrigerator": (
         {
             "title": "Heat Transfer Insulation Race",
             "emoji": "🌡️",
@@ -1135,9 +1151,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["refrigerator", "water", "cup", "cooking thermometer", "microwave", "clock", "paper", "pencil"],
             "learn": "You'll learn about Newton's Law of Cooling — objects lose heat proportional to the temperature difference with their surroundings.",
         },
-    ],
+    ),
 
-    "umbrella": [
+    "umbrella": (
         {
             "title": "Parachute Drop Science",
             "emoji": "🪂",
@@ -1172,9 +1188,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["umbrella", "cups", "straws", "tape", "pin", "stopwatch", "paper", "pencil"],
             "learn": "You'll learn about anemometry — how rotation rate relates to wind speed and how instruments are calibrated.",
         },
-    ],
+    ),
 
-    "cake": [
+    "cake": (
         {
             "title": "Baking Soda CO₂ Inflator",
             "emoji": "🎈",
@@ -1209,9 +1225,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["cake", "yeast", "sugar", "warm water", "cups", "balloons", "string", "ruler", "clock"],
             "learn": "You'll learn about fermentation — how yeast converts sugar into CO₂ and ethanol through cellular respiration.",
         },
-    ],
+    ),
 
-    "pizza": [
+    "pizza": (
         {
             "title": "Geometry of the Slice",
             "emoji": "📐",
@@ -1246,9 +1262,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["pizza", "paper towel", "newspaper", "cardboard", "wax paper", "vegetable oil", "ruler"],
             "learn": "You'll learn about porosity and absorption — how the pore structure of a material determines how much liquid it holds.",
         },
-    ],
+    ),
 
-    "donut": [
+    "donut": (
         {
             "title": "Torus Geometry Explorer",
             "emoji": "🍩",
@@ -1283,9 +1299,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["donut", "sugar", "water", "jar", "string", "pencil", "stove or microwave"],
             "learn": "You'll learn about supersaturation and crystallization — how dissolved molecules arrange into ordered crystal lattices.",
         },
-    ],
+    ),
 
-    "sandwich": [
+    "sandwich": (
         {
             "title": "Calorie Estimation Challenge",
             "emoji": "🧮",
@@ -1320,9 +1336,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["sandwich", "bread", "zip-lock bags", "water", "ruler", "clock", "paper", "pencil"],
             "learn": "You'll learn about microbial growth conditions — how moisture, warmth, and oxygen availability control mold proliferation.",
         },
-    ],
+    ),
 
-    "carrot": [
+    "carrot": (
         {
             "title": "Osmosis Shrinking Lab",
             "emoji": "🔬",
@@ -1357,9 +1373,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["carrot", "water", "shallow dish", "ruler", "paper", "pencil"],
             "learn": "You'll learn about plant regeneration and photosynthesis — how light availability directly controls growth rate.",
         },
-    ],
+    ),
 
-    "person": [
+    "person": (
         {
             "title": "Body Proportion Golden Ratio",
             "emoji": "📏",
@@ -1394,9 +1410,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["person", "2-litre bottle", "bowl", "water", "straw", "marker", "ruler"],
             "learn": "You'll learn about lung capacity and how to measure it using water displacement — the same principle Archimedes used.",
         },
-    ],
+    ),
 
-    "cat": [
+    "cat": (
         {
             "title": "Reaction Time Comparison: Human vs. Cat",
             "emoji": "⚡",
@@ -1431,9 +1447,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["cat", "paper", "pencil", "clock", "ruler", "coloured pens"],
             "learn": "You'll learn about ethology — the scientific study of animal behaviour using systematic observation and data recording.",
         },
-    ],
+    ),
 
-    "dog": [
+    "dog": (
         {
             "title": "Dog Hearing Frequency Test",
             "emoji": "🐕",
@@ -1468,7 +1484,7 @@ PROJECT_MAP: dict[str, list[dict]] = {
             "materials": ["dog", "treats", "paper", "pencil", "clock"],
             "learn": "You'll learn about operant conditioning — how reinforcement schedules shape behaviour and how to measure learning rate.",
         },
-    ],
+    ),
 }
 
 
@@ -1476,9 +1492,9 @@ PROJECT_MAP: dict[str, list[dict]] = {
 # COMBO_MAP  –  bonus STEM projects when 2+ specific objects are detected together
 # ─────────────────────────────────────────────────────────────────────────────
 
-COMBO_MAP: dict[frozenset, dict] = {
+COMBO_MAP: Mapping[frozenset, Mapping[str, Any]] = {
 
-    frozenset({"bottle", "balloon"}): {
+    frozenset(("bottle", "balloon")): {
         "title": "Gas Law Demonstrator",
         "emoji": "🎈",
         "difficulty": "Medium",
@@ -1496,7 +1512,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about Charles's Law — gas volume increases proportionally with absolute temperature.",
     },
 
-    frozenset({"cup", "spoon"}): {
+    frozenset(("cup", "spoon")): {
         "title": "Non-Newtonian Fluid Lab",
         "emoji": "🌀",
         "difficulty": "Easy",
@@ -1514,7 +1530,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about non-Newtonian fluids — materials whose viscosity changes under different rates of applied stress.",
     },
 
-    frozenset({"bottle", "cup"}): {
+    frozenset(("bottle", "cup")): {
         "title": "Hydraulic Lift Model",
         "emoji": "⚙️",
         "difficulty": "Hard",
@@ -1532,7 +1548,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about Pascal's principle — pressure applied to a confined fluid is transmitted equally in all directions.",
     },
 
-    frozenset({"apple", "orange"}): {
+    frozenset(("apple", "orange")): {
         "title": "Vitamin C Comparative Titration",
         "emoji": "🧪",
         "difficulty": "Hard",
@@ -1550,7 +1566,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about titration — measuring concentration by counting how much reactant is needed to neutralise a known indicator.",
     },
 
-    frozenset({"bowl", "spoon"}): {
+    frozenset(("bowl", "spoon")): {
         "title": "Standing Wave Resonance Mapper",
         "emoji": "🎵",
         "difficulty": "Medium",
@@ -1568,7 +1584,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about resonance — how the mass and tension of vibrating systems determines their natural frequency.",
     },
 
-    frozenset({"laptop", "book"}): {
+    frozenset(("laptop", "book")): {
         "title": "Comparative Reading Speed Study",
         "emoji": "📊",
         "difficulty": "Medium",
@@ -1586,7 +1602,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about cognitive load — how the reading medium affects processing speed and comprehension depth.",
     },
 
-    frozenset({"cell phone", "ruler"}): {
+    frozenset(("cell phone", "ruler")): {
         "title": "Gravity Constant Calculator",
         "emoji": "🍎",
         "difficulty": "Hard",
@@ -1604,7 +1620,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn how to experimentally determine a physical constant and calculate percentage error from a theoretical value.",
     },
 
-    frozenset({"scissors", "paper"}): {
+    frozenset(("scissors", "paper")): {
         "title": "Möbius Strip Topology Explorer",
         "emoji": "♾️",
         "difficulty": "Easy",
@@ -1622,7 +1638,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about topology — the branch of math that studies properties preserved through deformation, like one-sided surfaces.",
     },
 
-    frozenset({"carrot", "salt"}): {
+    frozenset(("carrot", "salt")): {
         "title": "Osmosis Quantification Experiment",
         "emoji": "⚗️",
         "difficulty": "Hard",
@@ -1640,7 +1656,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn how to find a solution's isotonic concentration — the point where osmosis reaches equilibrium.",
     },
 
-    frozenset({"umbrella", "stopwatch"}): {
+    frozenset(("umbrella", "stopwatch")): {
         "title": "Air Resistance Force Calculator",
         "emoji": "🪂",
         "difficulty": "Hard",
@@ -1658,7 +1674,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about terminal velocity — when drag force equals gravitational force, acceleration reaches zero.",
     },
 
-    frozenset({"fork", "spoon"}): {
+    frozenset(("fork", "spoon")): {
         "title": "Balanced Utensil Center of Mass Demo",
         "emoji": "⚖️",
         "difficulty": "Easy",
@@ -1676,7 +1692,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about center of mass — a system is stable when its combined center of mass hangs directly below its support point.",
     },
 
-    frozenset({"toothbrush", "baking soda"}): {
+    frozenset(("toothbrush", "baking soda")): {
         "title": "Acid Erosion Protection Test",
         "emoji": "🔬",
         "difficulty": "Medium",
@@ -1694,7 +1710,7 @@ COMBO_MAP: dict[frozenset, dict] = {
         "learn": "You'll learn about acid neutralisation — how bases like sodium bicarbonate chemically react with acids to protect surfaces.",
     },
 
-    frozenset({"clock", "pendulum"}): {
+    frozenset(("clock", "pendulum")): {
         "title": "Pendulum Period vs. Length Verification",
         "emoji": "⏱️",
         "difficulty": "Medium",
@@ -1714,51 +1730,439 @@ COMBO_MAP: dict[frozenset, dict] = {
 }
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Derived lookup tables  –  built once at import from the maps above
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Classes that have single-object projects; the single-object pass keeps
+# only the detected names found here.
+_VALID_CLASSES: frozenset[str] = frozenset(PROJECT_MAP)
+
+# Title index: the one read-only instance of every project, keyed by title.
+# Titles are unique across classes and combos; _canonical() raises if two
+# projects with different content ever share one.
+_PROJECT_POOL: dict[str, Mapping[str, Any]] = {}
+
+
+# Short scalar fields that repeat across the catalogue.
+_INTERNED_FIELDS = ("emoji", "difficulty", "time_est", "stem_tag")
+
+
+def _intern_strings(project: dict) -> None:
+    """Freeze materials/steps into tuples of interned strings."""
+    for field in ("materials", "steps"):
+        project[field] = tuple(map(sys.intern, project[field]))
+    for field in _INTERNED_FIELDS:
+        project[field] = sys.intern(project[field])
+
+
+# Leading duration in a time_est string: "25 mins", "20 mins + chill", "1 hour".
+_TIME_RE = re.compile(r"(\d+)\s*(mins?|hours?|hrs?)")
+
+
+def _parse_minutes(time_est: str) -> int:
+    """Return the leading duration of *time_est* in minutes, or 0."""
+    match = _TIME_RE.search(time_est)
+    if match is None:
+        return 0
+    amount, unit = int(match.group(1)), match.group(2)
+    return amount if unit.startswith("min") else amount * 60
+
+
+def _canonical(project: dict) -> Mapping[str, Any]:
+    """Return the pooled, interned, read-only instance of *project*."""
+    _intern_strings(project)
+    project["time_min"] = _parse_minutes(project["time_est"])
+    pooled = _PROJECT_POOL.setdefault(project["title"], MappingProxyType(project))
+    if pooled != project:
+        raise ValueError(f"conflicting projects share the title {project['title']!r}")
+    return pooled
+
+
+DIFF_RANK: Mapping[str, int] = MappingProxyType({"Easy": 0, "Medium": 1, "Hard": 2})
+DIFF_LABELS: tuple[str, ...] = tuple(DIFF_RANK)
+
+
+def _easiest_first(project: Mapping[str, Any]) -> tuple[int, int]:
+    """Sort key: difficulty rank, then parsed minutes."""
+    return DIFF_RANK[project["difficulty"]], project["time_min"]
+
+
+# Freeze the catalogue: both maps and every project become read-only views,
+# so no consumer can corrupt the shared pool or the memoised suggestions.
+# Each class's projects are ordered easiest and quickest first, once, here;
+# the UI lists them in that order and suggestion ties break the same way.
+# Class names are interned like the materials, matching detector labels.
+PROJECT_MAP = MappingProxyType({
+    sys.intern(obj_name): tuple(sorted(map(_canonical, projects), key=_easiest_first))
+    for obj_name, projects in PROJECT_MAP.items()
+})
+COMBO_MAP = MappingProxyType({
+    frozenset(map(sys.intern, key_set)): _canonical(project)
+    for key_set, project in COMBO_MAP.items()
+})
+
+# Flat catalogue of every distinct project (single-object first, then combos).
+_ALL_PROJECTS: tuple[Mapping[str, Any], ...] = tuple(_PROJECT_POOL.values())
+
+# Every name that can change a suggestion: project classes, combo members and
+# materials. Other labels are dropped from the cache key, so frames that only
+# differ by an irrelevant object (a passing car, say) share one cache entry.
+_RELEVANT_NAMES: frozenset[str] = frozenset(
+    name for project in _ALL_PROJECTS for name in project["materials"]
+).union(_VALID_CLASSES, *COMBO_MAP)
+
+# Smallest combo (currently every combo is a pair) and every name a combo uses.
+_MIN_COMBO_SIZE: int = min(map(len, COMBO_MAP))
+_COMBO_MEMBERS: tuple[str, ...] = tuple(sorted(frozenset().union(*COMBO_MAP)))
+
+# Shared name vocabulary: each relevant name gets one bit, and a set of names
+# is stored as a single int over those bits. Materials then score with an AND
+# plus a popcount instead of a set intersection that allocates a new set.
+_NAME_VOCAB: tuple[str, ...] = tuple(sorted(_RELEVANT_NAMES))
+_NAME_BIT: dict[str, int] = {name: 1 << i for i, name in enumerate(_NAME_VOCAB)}
+
+
+def _norm(name: str) -> str:
+    """Fold case, spaces and underscores: "Cell_Phone" → "cellphone"."""
+    return name.lower().replace(" ", "").replace("_", "")
+
+
+# Normalised spelling → catalogue spelling, for detector labels that differ
+# only in case or separators ("cellphone", "Cell Phone", "teddy_bear").
+_NORMALIZED_NAMES: dict[str, str] = {_norm(name): name for name in _NAME_VOCAB}
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_class(name: str) -> str | None:
+    """Return the catalogue spelling of *name*, or None if it is unknown."""
+    return _NORMALIZED_NAMES.get(_norm(name))
+
+
+def _name_mask(names: Iterable[str]) -> int:
+    """Encode *names* as a bitmask over _NAME_VOCAB, ignoring unknown names."""
+    mask = 0
+    for name in names:
+        mask |= _NAME_BIT.get(name, 0)
+    return mask
+
+
+# Combo keys as bitmasks, plus the union of them all. A frame whose mask
+# shares fewer than _MIN_COMBO_SIZE bits with _COMBO_UNIVERSE cannot unlock
+# any combo.
+_COMBO_MASKS: tuple[tuple[int, Mapping[str, Any]], ...] = tuple(
+    (_name_mask(key_set), project) for key_set, project in COMBO_MAP.items()
+)
+_COMBO_UNIVERSE: int = _name_mask(_COMBO_MEMBERS)
+
+
+class _CatalogueColumns(NamedTuple):
+    """
+    Whole-catalogue columns parallel to _ALL_PROJECTS, so filters compare
+    small ints and strings without touching the project mappings.
+    """
+    obj_names: tuple[str | None, ...]   # owning class, None for combos
+    difficulty: tuple[int, ...]         # DIFF_RANK value
+    minutes: tuple[int, ...]            # parsed time_est
+    materials: tuple[int, ...]          # materials bitmask
+
+
+def _catalogue_columns() -> _CatalogueColumns:
+    """Build the catalogue columns once, in _ALL_PROJECTS order."""
+    owners: dict[int, str] = {}
+    for obj_name, projects in PROJECT_MAP.items():
+        for project in projects:
+            owners.setdefault(id(project), obj_name)
+    return _CatalogueColumns(
+        obj_names=tuple(owners.get(id(p)) for p in _ALL_PROJECTS),
+        difficulty=tuple(DIFF_RANK[p["difficulty"]] for p in _ALL_PROJECTS),
+        minutes=tuple(p["time_min"] for p in _ALL_PROJECTS),
+        materials=tuple(_name_mask(p["materials"]) for p in _ALL_PROJECTS),
+    )
+
+
+_CATALOGUE: _CatalogueColumns = _catalogue_columns()
+
+
+def _material_index() -> dict[str, frozenset[int]]:
+    """Invert the catalogue: material → positions in _ALL_PROJECTS using it."""
+    index: dict[str, set[int]] = defaultdict(set)
+    for pid, project in enumerate(_ALL_PROJECTS):
+        for material in project["materials"]:
+            index[material].add(pid)
+    return {material: frozenset(pids) for material, pids in index.items()}
+
+
+_MATERIAL_INDEX: dict[str, frozenset[int]] = _material_index()
+
+
+class _ClassColumns(NamedTuple):
+    """
+    Per-class scoring columns, struct-of-arrays style: parallel tuples of
+    titles, materials bitmasks and the project dicts themselves. The
+    scoring pass reads only the first two, so a project dict is not touched
+    until it is returned.
+    """
+    titles: tuple[str, ...]
+    materials: tuple[int, ...]
+    projects: tuple[Mapping[str, Any], ...]
+
+
+_SCORING_COLUMNS: dict[str, _ClassColumns] = {
+    obj_name: _ClassColumns(
+        titles=tuple(project["title"] for project in projects),
+        materials=tuple(_name_mask(project["materials"]) for project in projects),
+        projects=projects,
+    )
+    for obj_name, projects in PROJECT_MAP.items()
+}
+
+# Every possible single-object score: 0 up to the longest materials list.
+_SCORE_RANGE: range = range(
+    max(mask.bit_count() for cols in _SCORING_COLUMNS.values() for mask in cols.materials)
+    + 1
+)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Suggestion engine
 # ─────────────────────────────────────────────────────────────────────────────
 
-def get_project_suggestions(
-    detected_names: List[str],
+class Suggestion(NamedTuple):
+    """A ranked suggestion: its score and combo flag beside the shared project."""
+    score: int
+    is_combo: bool
+    project: Mapping[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a mutable copy of the project stamped with _score/_is_combo."""
+        return {**self.project, "_score": self.score, "_is_combo": self.is_combo}
+
+
+def get_project_by_title(title: str) -> Mapping[str, Any] | None:
+    """Return the canonical (read-only) project for *title*, or None."""
+    return _PROJECT_POOL.get(title)
+
+
+def get_projects(obj_name: str) -> tuple[Mapping[str, Any], ...]:
+    """
+    Return the single-object projects for *obj_name*, easiest first.
+
+    Labels are resolved through resolve_class(); unknown ones give ().
+    """
+    return PROJECT_MAP.get(obj_name) or PROJECT_MAP.get(resolve_class(obj_name), ())
+
+
+def get_projects_makeable_with(have: Iterable[str]) -> List[Mapping[str, Any]]:
+    """
+    Return every project whose materials are all in *have*, catalogue order.
+
+    *have* is encoded as one bitmask, after which each project check is a
+    single integer AND against its precomputed materials mask.
+    """
+    have_mask = _name_mask(have)
+    return [
+        project
+        for project, mask in zip(_ALL_PROJECTS, _CATALOGUE.materials)
+        if mask & have_mask == mask
+    ]
+
+
+def find_projects_using(materials: Iterable[str]) -> List[Mapping[str, Any]]:
+    """
+    Return every project that uses all of *materials*, catalogue order.
+
+    Answered from the material → project inverted index by intersecting the
+    posting sets, so no project's materials are scanned.
+    """
+    wanted = frozenset(materials)
+    if not wanted or not wanted <= _MATERIAL_INDEX.keys():
+        # Nothing asked for, or some material is used by no project at all.
+        return []
+    # Start from the rarest material so the intersection stays small.
+    postings = sorted((_MATERIAL_INDEX[m] for m in wanted), key=len)
+    pids = postings[0].intersection(*postings[1:])
+    return [_ALL_PROJECTS[pid] for pid in sorted(pids)]
+
+
+def find_projects(
+    obj_name: str | None = None,
+    difficulty: str | None = None,
+    max_minutes: int | None = None,
+) -> List[Mapping[str, Any]]:
+    """
+    Return catalogue projects matching every filter given, catalogue order.
+
+    *obj_name* keeps single-object projects of that class, resolved through
+    resolve_class() (an unknown class matches nothing); *difficulty* is one
+    of DIFF_LABELS; *max_minutes* caps the parsed time_est. Filters run over
+    the precomputed columns.
+
+    Raises ValueError if *difficulty* is not one of DIFF_LABELS.
+    """
+    if obj_name is not None:
+        obj_name = resolve_class(obj_name)
+        if obj_name is None:
+            return []
+    if difficulty is None:
+        rank = None
+    elif difficulty in DIFF_RANK:
+        rank = DIFF_RANK[difficulty]
+    else:
+        raise ValueError(f"difficulty must be one of {DIFF_LABELS}, got {difficulty!r}")
+    return [
+        project
+        for project, owner, diff, minutes in zip(
+            _ALL_PROJECTS,
+            _CATALOGUE.obj_names,
+            _CATALOGUE.difficulty,
+            _CATALOGUE.minutes,
+        )
+        if (obj_name is None or owner == obj_name)
+        and (rank is None or diff == rank)
+        and (max_minutes is None or minutes <= max_minutes)
+    ]
+
+
+def _detected_key(detected: Iterable[str]) -> tuple[str, ...]:
+    """
+    Collapse detector labels to the catalogue names that can matter, each
+    once, in first-seen order. run_inference() sorts by confidence, so the
+    most confident object's projects win ties.
+    """
+    names = dict.fromkeys(detected)
+    if not names.keys() <= _RELEVANT_NAMES:
+        # Some labels are unknown or spelled differently; normalise them.
+        names = dict.fromkeys(filter(None, map(resolve_class, names)))
+    return tuple(names)
+
+
+@functools.lru_cache(maxsize=512)
+def _combo_hits(combo_mask: int) -> tuple[Mapping[str, Any], ...]:
+    """
+    Return every combo project whose objects are all set in *combo_mask*,
+    in COMBO_MAP order.
+
+    Callers pass only the combo-relevant bits (``mask & _COMBO_UNIVERSE``),
+    so frames that differ only in non-combo detections share a cache entry.
+    """
+    if combo_mask.bit_count() < _MIN_COMBO_SIZE:
+        return ()
+    # A straight scan of the 13 masks, already in COMBO_MAP order, beats
+    # gathering posting lists at this catalogue size.
+    return tuple(project for mask, project in _COMBO_MASKS if mask & combo_mask == mask)
+
+
+def _single_candidates(
+    classes: Iterable[str],
+    detected_mask: int,
+    seen_titles: set[str],
+) -> Iterator[tuple[int, Mapping[str, Any]]]:
+    """Lazily yield (score, project) for every project of *classes*."""
+    for obj_name in classes:
+        columns = _SCORING_COLUMNS[obj_name]
+        for title, mat_mask, project in zip(
+            columns.titles, columns.materials, columns.projects
+        ):
+            if title in seen_titles:
+                continue
+            seen_titles.add(title)
+            yield (mat_mask & detected_mask).bit_count(), project
+
+
+def iter_project_suggestions(
+    detected: Iterable[str],
     max_results: int = 3,
-) -> List[dict]:
+) -> Iterator[Suggestion]:
     """
-    Return up to *max_results* project dicts, combo projects first.
+    Lazily yield up to *max_results* suggestions, best first.
 
-    Scoring rules
-    -------------
-    1. Combo projects score 1000 when ALL required objects appear in detected_names.
-    2. Single-object projects score by count of their materials in detected_names.
-    3. Ties broken by insertion order.
-    4. Duplicate titles are filtered out.
+    Combo hits always outrank single-object projects, so each one is yielded
+    the moment it matches. The single-object pass buckets candidates by
+    score and wraps only the winners, walking the buckets from the top.
+    Ordering follows the scoring rules of get_project_suggestions().
     """
-    detected_set = set(detected_names)
-    results: list[dict] = []
+    detected_key = _detected_key(detected)
+    detected_mask = _name_mask(detected_key)
     seen_titles: set[str] = set()
+    remaining = max_results
+    if remaining <= 0:
+        return
 
     # ── Step 1: Combo projects (highest priority) ──────────────────────────
-    for key_set, project in COMBO_MAP.items():
-        if key_set <= detected_set:
-            p = dict(project)
-            p["_score"]    = 1000
-            p["_is_combo"] = True
-            if p["title"] not in seen_titles:
-                results.append(p)
-                seen_titles.add(p["title"])
+    for project in _combo_hits(detected_mask & _COMBO_UNIVERSE):
+        if project["title"] in seen_titles:
+            continue
+        seen_titles.add(project["title"])
+        yield Suggestion(1000, True, project)
+        remaining -= 1
+        if remaining == 0:
+            # Every combo ties at 1000, so a full quota ends the search.
+            return
 
     # ── Step 2: Single-object projects, scored by material overlap ─────────
-    for obj_name in detected_names:
-        for project in PROJECT_MAP.get(obj_name, []):
-            if project["title"] in seen_titles:
-                continue
-            mat_set = set(project.get("materials", []))
-            score   = len(mat_set & detected_set)
-            p = dict(project)
-            p["_score"]    = score
-            p["_is_combo"] = False
-            results.append(p)
-            seen_titles.add(project["title"])
-
-    # ── Step 3: Sort by score descending, trim to max_results ─────────────
-    results.sort(key=lambda x: x["_score"], reverse=True)
-    return results[:max_results]
+    # Scores are small ints within _SCORE_RANGE, so bucket the candidates by
+    # score and walk the buckets from the top instead of sorting. Appending
+    # keeps each bucket in insertion order, so ties stay stable.
+    buckets: list[list[Mapping[str, Any]]] = [[] for _ in _SCORE_RANGE]
+    classes = (c for c in detected_key if c in _VALID_CLASSES)
+    for score, project in _single_candidates(classes, detected_mask, seen_titles):
+        buckets[score].append(project)
+    for score in reversed(_SCORE_RANGE):
+        for project in buckets[score]:
+            yield Suggestion(score, False, project)
+            remaining -= 1
+            if remaining == 0:
+                return
+
+
+# The common webcam case is one object in view. No combo can match a single
+# detection, so each class's full ranked answer is precomputed here and the
+# hot path only slices it.
+_SINGLE_HIT: dict[str, tuple[Suggestion, ...]] = {
+    obj_name: tuple(iter_project_suggestions((obj_name,), len(projects)))
+    for obj_name, projects in PROJECT_MAP.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _suggest_cached(detected_key: tuple[str, ...]) -> tuple[Suggestion, ...]:
+    """
+    Memoised full ranking; consecutive frames usually repeat the same key.
+
+    Keyed on the detected names alone and sliced by the caller, so requests
+    for 2 and 3 results (live and captured views) share one entry.
+    """
+    return tuple(iter_project_suggestions(detected_key, len(_ALL_PROJECTS)))
+
+
+def get_project_suggestions(
+    detected: Iterable[str],
+    max_results: int = 3,
+) -> List[Suggestion]:
+    """
+    Return up to *max_results* suggestions, combo projects first.
+
+    *detected* may be any iterable of class names; it is deduplicated once
+    on entry, keeping first-seen order, so repeated labels (several
+    instances of the same object in one frame) are only looked up and
+    scored once. Labels that differ from the catalogue only in case, spaces
+    or underscores are resolved through resolve_class().
+
+    Each Suggestion carries the shared, read-only catalogue project rather
+    than a copy; use Suggestion.to_dict() when a mutable record is needed.
+
+    Scoring rules
+    -------------
+    1. Combo projects score 1000 when ALL required objects appear in detected.
+    2. Single-object projects score by count of their materials in detected.
+    3. Ties broken by insertion order.
+    4. Duplicate titles are filtered out.
+    """
+    if max_results <= 0:
+        return []
+    key = _detected_key(detected)
+    if len(key) == 1:
+        (obj_name,) = key
+        return list(_SINGLE_HIT.get(obj_name, ())[:max_results])
+    return list(_suggest_cached(key)[:max_results])
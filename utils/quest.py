@@ -6,10 +6,12 @@ Quest generation and detection checking for the Scavenger Hunt game mode.
 
 from __future__ import annotations
 
-import random
-from typing import List, Set
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Mapping, Set
 
-COCO_EMOJIS: dict[str, str] = {
+_COCO_EMOJIS: dict[str, str] = {
     "person": "🧑",
     "bicycle": "🚲",
     "car": "🚗",
@@ -92,34 +94,109 @@ COCO_EMOJIS: dict[str, str] = {
     "toothbrush": "🪥",
 }
 
+# Class names are interned so lookups with interned detector labels (see
+# utils/detection.py) match on identity before comparing characters. The
+# lookup is bound to the private dict; callers get a read-only view.
+_COCO_EMOJIS = {sys.intern(name): emoji for name, emoji in _COCO_EMOJIS.items()}
+_EMOJI_GET = _COCO_EMOJIS.get
+COCO_EMOJIS: Mapping[str, str] = MappingProxyType(_COCO_EMOJIS)
+
+# The 80 COCO class names indexed by class id, so a detector's integer id
+# picks its emoji directly without hashing the name.
+_COCO_ORDER: tuple[str, ...] = tuple(map(sys.intern, (
+    "person", "bicycle", "car", "motorcycle", "airplane", "bus", "train",
+    "truck", "boat", "traffic light", "fire hydrant", "stop sign",
+    "parking meter", "bench", "bird", "cat", "dog", "horse", "sheep", "cow",
+    "elephant", "bear", "zebra", "giraffe", "backpack", "umbrella", "handbag",
+    "tie", "suitcase", "frisbee", "skis", "snowboard", "sports ball", "kite",
+    "baseball bat", "baseball glove", "skateboard", "surfboard",
+    "tennis racket", "bottle", "wine glass", "cup", "fork", "knife", "spoon",
+    "bowl", "banana", "apple", "sandwich", "orange", "broccoli", "carrot",
+    "hot dog", "pizza", "donut", "cake", "chair", "couch", "potted plant",
+    "bed", "dining table", "toilet", "tv", "laptop", "mouse", "remote",
+    "keyboard", "cell phone", "microwave", "oven", "toaster", "sink",
+    "refrigerator", "book", "clock", "vase", "scissors", "teddy bear",
+    "hair drier", "toothbrush",
+)))
+_EMOJI_BY_ID: tuple[str, ...] = tuple(_EMOJI_GET(name, "❓") for name in _COCO_ORDER)
+if len(_COCO_ORDER) != 80 or set(_COCO_ORDER) != COCO_EMOJIS.keys():
+    raise RuntimeError("_COCO_ORDER and COCO_EMOJIS must name the same 80 COCO classes")
+
 # Items biased toward things findable indoors / at school
-PREFERRED_CLASSES: list[str] = [
+PREFERRED_CLASSES: tuple[str, ...] = tuple(map(sys.intern, (
     "person", "cat", "dog", "cup", "bottle", "book", "chair",
     "laptop", "cell phone", "keyboard", "mouse", "remote", "clock",
     "backpack", "teddy bear", "scissors", "toothbrush", "apple",
     "banana", "orange", "couch", "potted plant", "bowl", "spoon",
     "fork", "vase", "bed", "tv", "sink", "refrigerator", "umbrella",
     "cake", "pizza", "donut", "sandwich", "carrot",
-]
+)))
 
 
 def get_emoji(class_name: str) -> str:
-    return COCO_EMOJIS.get(class_name, "❓")
+    return _EMOJI_GET(class_name, "❓")
+
+
+def get_emoji_by_id(class_id: int, class_name: str | None = None) -> str:
+    """
+    Emoji for a COCO class id, as emitted by COCO-trained YOLO models.
+
+    When *class_name* is given and the id does not name that COCO class
+    (a model with another label set), fall back to get_emoji(class_name)
+    so the emoji always matches the label shown beside it.
+    """
+    if 0 <= class_id < len(_EMOJI_BY_ID) and (
+        class_name is None or _COCO_ORDER[class_id] == class_name
+    ):
+        return _EMOJI_BY_ID[class_id]
+    return "❓" if class_name is None else get_emoji(class_name)
+
 
+@dataclass
+class Quest:
+    """A scavenger hunt: the items to find, in board order, and those found."""
+    items: tuple[str, ...]
+    found: Set[str] = field(default_factory=set)
+    items_set: frozenset[str] = field(init=False, repr=False)
 
-def generate_quest(n: int = 5) -> List[str]:
-    pool = list(PREFERRED_CLASSES)
-    random.shuffle(pool)
-    return pool[:n]
+    def __post_init__(self) -> None:
+        # Built once per game, so per-frame membership checks are hashed.
+        self.items_set = frozenset(self.items)
+
+    @property
+    def complete(self) -> bool:
+        return self.items_set <= self.found
+
+
+def generate_quest(n: int = 5) -> Quest:
+    # Imported here: callers that only need the emoji table skip loading
+    # random. sample() draws only n items instead of shuffling the pool.
+    from random import sample
+
+    return Quest(tuple(sample(PREFERRED_CLASSES, min(n, len(PREFERRED_CLASSES)))))
 
 
 def check_detections(
     detected_names: List[str],
-    quest_items: List[str],
-    quest_found: Set[str],
+    quest: Quest,
+    preserve_order: bool = True,
 ) -> List[str]:
-    """Return quest items newly detected that weren't already found."""
-    return [
-        name for name in detected_names
-        if name in quest_items and name not in quest_found
-    ]
+    """
+    Return quest items newly detected that weren't already found.
+
+    Each item is reported once, in first-detected order, even when the
+    frame holds several instances of it. With preserve_order=False the
+    items come straight from set algebra, in arbitrary order.
+    """
+    # Filter in C first: most frames hold no unfound quest item at all.
+    hits = quest.items_set.intersection(detected_names) - quest.found
+    if not hits or not preserve_order:
+        return list(hits)
+    # Restore first-detected order, stopping once every hit is placed.
+    newly_found: List[str] = []
+    for name in detected_names:
+        if name in hits and name not in newly_found:
+            newly_found.append(name)
+            if len(newly_found) == len(hits):
+                break
+    return newly_found